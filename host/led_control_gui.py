@@ -1,17 +1,19 @@
 #!/usr/bin/env python
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox # filedialog is imported on first Export/Import
 import serial # type: ignore # Ignore type checking for pyserial if stubs aren't present
 import threading
 import time
 import json
 import queue
+import collections
 import os
 import re
-from serial.tools import list_ports # type: ignore
 from datetime import datetime # No need for timedelta here
-# Removed ThreadPoolExecutor from BoardConnection, using direct threads for simplicity now
-# from concurrent.futures import ThreadPoolExecutor # Keep if needed for connect/disconnect futures
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+try: import orjson # type: ignore # Optional: faster settings import/export when installed
+except ImportError: orjson = None
 
 # Constants
 MAX_BOARDS = 16
@@ -24,6 +26,8 @@ LED_COLORS = {
     'UV': "#9400D3", 'FAR_RED': "#8B0000", 'RED': "#FF0000",
     'WHITE': "#E0E0E0", 'GREEN': "#00FF00", 'BLUE': "#0000FF"
 }
+# (name, index, swatch color) per channel, in channel order; used when building board frames
+CHANNELS = tuple((name, idx, LED_COLORS.get(name, "#CCCCCC")) for name, idx in LED_CHANNELS.items())
 
 # --- UI Constants ---
 UI_COLORS = {
@@ -41,15 +45,16 @@ BOARD_LAYOUT = {
     'padding': 5, 'frame_padding': 10
 }
 TIMINGS = {
-    'status_update_batch': 150,   # ms between status updates (slightly longer batch)
     'scheduler_default': 1000,    # default scheduler check interval (ms)
-    'scheduler_urgent': 100,      # urgent scheduler check interval (ms)
-    'scheduler_normal': 1000,     # normal scheduler check interval (ms)
-    'scheduler_relaxed': 5000,    # relaxed scheduler check interval (ms)
+    'scheduler_min': 500,         # shortest wait between scheduler checks (ms)
+    'scheduler_max': 60000,       # longest wait (no schedules enabled / clock-change resync) (ms)
+    'scheduler_slack': 50,        # land just after the minute boundary of a transition (ms)
     'serial_timeout': 1.0,        # Serial read/write timeout
     'serial_retry_delay': 0.5,    # Base delay between serial retries
+    'connect_settle_max': 1.8,    # Upper bound on waiting for the post-open PING answer (s)
+    'connect_ping_interval': 0.25, # PING is re-sent this often until the board first answers (s)
     'queue_check_interval': 100,  # ms between checking the GUI queue
-    'apply_batch_delay': 0.02     # Small delay between queuing apply commands in a batch
+    'queue_check_idle_max': 250   # GUI queue poll backs off to this while idle; worker results wait at most this long (ms)
 }
 CMD_MESSAGES = {
     'scan_start': "Scanning for boards...", 'scan_complete': "Board scan complete",
@@ -80,8 +85,8 @@ DEFAULT_DOCUMENTS_PATH = os.path.join(os.path.expanduser("~"), "Documents")
 # ** MODIFIED: Updated regex to match HHMM format **
 TIME_PATTERN = re.compile(r'^([0-1][0-9]|2[0-3])([0-5][0-9])$') # HHMM format
 SERIAL_MAPPING_PATTERN = re.compile(r'^(\d+):(.+)$')
-CHAMBER_NUM_PATTERN = re.compile(r'chamber_(\d+)')
-DUTY_CYCLE_LOOKUP = {i: int((i / 100.0) * 4095) for i in range(101)}
+CHAMBER_NUM_PATTERN = re.compile(r'^chamber_(\d+)$') # Whole-key match for export keys
+DUTY_CYCLE_LOOKUP = tuple(i * 4095 // 100 for i in range(101)) # Index = percentage 0-100; integer-exact
 ZERO_DUTY_CYCLES = tuple([0] * NUM_LED_CHANNELS) # Use tuple for immutable zero array
 # --- End Cached Regex and Lookups ---
 
@@ -93,9 +98,10 @@ class StatusUpdate(GUIAction):
         self.message = message
         self.is_error = is_error
 class BoardsDetected(GUIAction):
-    def __init__(self, boards, error=None):
+    def __init__(self, boards, error=None, changed=True):
         self.boards = boards
         self.error = error
+        self.changed = changed # False when a rescan found the same board set
 class CommandComplete(GUIAction):
     def __init__(self, board_idx, command_type, success, message, extra_info=None):
         self.board_idx = board_idx
@@ -114,21 +120,69 @@ class FileOperationComplete(GUIAction):
         self.success = success
         self.message = message
         self.data = data
+class SettingsFileLoaded(GUIAction):
+    def __init__(self, settings, file_path):
+        self.settings = settings
+        self.file_path = file_path
 # --- End GUI Action Classes ---
 
 
+# --- Schedule Record ---
+def time_to_minutes(time_str_hhmm):
+    """Convert an internal HH:MM string to minutes since midnight."""
+    h, m = time_str_hhmm.split(':')
+    return int(h) * 60 + int(m)
+
+@lru_cache(maxsize=None)
+def active_minutes_map(on_min, off_min):
+    """Immutable 1440-byte map; byte m is 1 when the channel is scheduled ON at minute m (end exclusive)."""
+    if on_min == off_min: return b'\x01' * 1440 # Same ON/OFF time = ON all day
+    bits = bytearray(1440)
+    if on_min < off_min: bits[on_min:off_min] = b'\x01' * (off_min - on_min) # Normal interval
+    else: bits[on_min:] = b'\x01' * (1440 - on_min); bits[:off_min] = b'\x01' * off_min # Wraparound
+    return bytes(bits) # Shared between schedules with the same times, so keep it read-only
+
+class ChannelSchedule:
+    """ON/OFF schedule for one LED channel. Times use the internal HH:MM format."""
+    __slots__ = ('on_time', 'off_time', 'on_min', 'off_min', 'active_minutes', 'enabled', 'active')
+
+    def __init__(self, on_time="08:00", off_time="00:00", enabled=False, active=True):
+        self.enabled = enabled
+        self.active = active
+        self.set_times(on_time, off_time)
+
+    def set_times(self, on_time, off_time):
+        """Set validated HH:MM times and cache their minute-of-day values."""
+        self.on_time = on_time; self.off_time = off_time
+        self.on_min = time_to_minutes(on_time); self.off_min = time_to_minutes(off_time)
+        self.active_minutes = active_minutes_map(self.on_min, self.off_min)
+# --- End Schedule Record ---
+
+
 class BoardConnection:
     """
     Manages serial connection and command queue for a board. Optimized for RPi.
     """
+    __slots__ = ('port', 'serial_number', 'chamber_number', 'gui_queue', 'serial_conn', 'is_connected',
+                 'last_error', 'fan_speed', 'fan_enabled', 'lock', 'command_queue',
+                 'command_processor_thread', 'stop_event', 'last_duty')
     CMD_SETALL = "SETALL"
     CMD_FAN_SET = "FAN_SET"
+    CMD_CONNECT = "CONNECT" # Open the port ahead of the first real command; not reported on success
+    COMMAND_FORMATS = { # Wire format per command type, filled with bytes %-formatting
+        CMD_SETALL: b"SETALL %d %d %d %d %d %d\n",
+        CMD_FAN_SET: b"FAN_SET %d\n",
+    }
+    PING = b"PING\n" # Readiness probe sent right after opening the port
     RESP_OK = b"OK" # Use bytes for direct comparison
+    MSG_UNCHANGED = "Unchanged" # CommandComplete message for a SETALL skipped because the board already has it
     RESP_ERR_PREFIX = b"ERR:" # Use bytes
     MAX_RETRIES = 2 # Slightly fewer retries for faster failure
     READ_TIMEOUT = TIMINGS['serial_timeout']
     WRITE_TIMEOUT = TIMINGS['serial_timeout']
     RETRY_DELAY = TIMINGS['serial_retry_delay']
+    SETTLE_MAX = TIMINGS['connect_settle_max']
+    PING_INTERVAL = TIMINGS['connect_ping_interval']
 
     def __init__(self, port, serial_number, gui_queue, chamber_number=None):
         self.port = port
@@ -140,10 +194,11 @@ class BoardConnection:
         self.last_error = ""
         self.fan_speed = 0
         self.fan_enabled = False
-        self.lock = threading.RLock() # Lock for accessing shared resources (serial_conn, state)
+        self.lock = threading.Lock() # Guards shared resources (serial_conn, state); never taken re-entrantly
         self.command_queue = queue.Queue()
         self.command_processor_thread = None
         self.stop_event = threading.Event()
+        self.last_duty = None # Duty tuple the board last acknowledged; None = unknown
         self._start_command_processor() # Start processor on init
 
     def _connect(self):
@@ -158,26 +213,47 @@ class BoardConnection:
             self.serial_conn = serial.Serial(port=self.port, baudrate=115200,
                                              timeout=self.READ_TIMEOUT,
                                              write_timeout=self.WRITE_TIMEOUT)
-            time.sleep(1.8) # Slightly shorter wait after connect
-            if self.serial_conn.in_waiting > 0:
-                self.serial_conn.reset_input_buffer()
+            try: self.serial_conn.set_low_latency_mode(True) # Linux: skip the USB-serial latency timer
+            except (AttributeError, ValueError, OSError): pass # Not POSIX, or driver lacks ASYNC_LOW_LATENCY
+            if not self._wait_until_ready(): # A late OK would be read as the next command's reply
+                raise serial.SerialException(f"No reply to PING within {self.SETTLE_MAX}s")
             self.is_connected = True
             self.last_error = ""
             # print(f"[{self.port}] Connection successful.") # Less verbose
             return True
         except serial.SerialException as e:
             self.last_error = f"Serial Error: {str(e)}"
-            self.is_connected = False
-            self.serial_conn = None
+            self._disconnect() # Close a port that opened but never became ready
             print(f"[{self.port}] Connection failed: {self.last_error}")
             return False
         except Exception as e:
             self.last_error = f"Unexpected Connect Error: {str(e)}"
-            self.is_connected = False
-            self.serial_conn = None
+            self._disconnect()
             print(f"[{self.port}] Connection failed unexpectedly: {self.last_error}")
             return False
 
+    def _wait_until_ready(self):
+        """PING the board after open until it answers; False if connect_settle_max passes first."""
+        conn = self.serial_conn
+        deadline = time.monotonic() + self.SETTLE_MAX
+        conn.reset_input_buffer() # Drop anything printed before we opened
+        sent = answered = 0; resend = True
+        try:
+            while time.monotonic() < deadline:
+                if resend and not answered: # A PING written while the board is still booting can be lost
+                    conn.timeout = min(self.PING_INTERVAL, max(deadline - time.monotonic(), 0.01)) # Once per PING; each set reconfigures the port
+                    conn.write(self.PING); conn.flush(); sent += 1
+                line = conn.readline()
+                resend = not line # Interval ran out with no line; PING again
+                # Any reply means the command loop is running; firmware without PING answers ERR:INVALID_CMD
+                if self.RESP_OK in line or line.startswith(self.RESP_ERR_PREFIX):
+                    answered += 1
+                    if answered == sent: return True # Every PING answered; no late reply left to arrive
+                # Otherwise it is boot output (e.g. "Board controller ready"); keep reading
+        finally: conn.timeout = self.READ_TIMEOUT
+        if answered: conn.reset_input_buffer() # Earlier PINGs went unanswered; drop any reply still in flight
+        return answered > 0
+
     def _disconnect(self):
         """Synchronous disconnect attempt (called within locked context)."""
         if self.serial_conn:
@@ -186,16 +262,16 @@ class BoardConnection:
             except Exception as e: print(f"[{self.port}] Error closing serial port: {e}")
         self.is_connected = False
         self.serial_conn = None
+        self.last_duty = None # Board state unknown until the next acknowledged SETALL
         # print(f"[{self.port}] Disconnected.") # Less verbose
 
-    def _send_receive_command(self, command_str):
-        """Sends command, reads response line. Handles retries and reconnect."""
+    def _send_receive_command(self, command_bytes):
+        """Sends a newline-terminated command (bytes), reads response line. Handles retries and reconnect."""
         with self.lock:
             if not self.is_connected:
                 if not self._connect():
                     return False, self.last_error # Return connection error
 
-            command_bytes = (command_str + '\n').encode('utf-8')
             retries = 0
             while retries <= self.MAX_RETRIES:
                 if not self.is_connected: # Check connection at start of each retry loop
@@ -243,18 +319,24 @@ class BoardConnection:
             return False, f"Send/Receive failed after {self.MAX_RETRIES} retries"
 
 
-    def _execute_command(self, command_type, args, board_idx):
-        """Executes the command and handles communication."""
+    def _execute_command(self, command_type, args, board_idx, force=False):
+        """Executes the command and handles communication. force=True sends even if the board already has args."""
         success = False
         message = "Command execution failed"
         try:
-            if command_type == self.CMD_SETALL:
-                command_str = f"{self.CMD_SETALL} {' '.join(map(str, args))}"
-                success, message = self._send_receive_command(command_str)
-            elif command_type == self.CMD_FAN_SET:
-                command_str = f"{self.CMD_FAN_SET} {args}"
-                success, message = self._send_receive_command(command_str)
-                if success: # Update internal state only on success
+            if command_type == self.CMD_CONNECT:
+                with self.lock: connected = self._connect()
+                if not connected:
+                    self.gui_queue.append(StatusUpdate(f"Chamber {self.chamber_number}: connect failed - {self.last_error}", True))
+                return
+            if command_type == self.CMD_SETALL and not force and args == self.last_duty: # Board already shows these values
+                success, message = True, self.MSG_UNCHANGED
+            else:
+                if command_type == self.CMD_SETALL: self.last_duty = None # Unknown until this exchange succeeds
+                success, message = self._send_receive_command(self.COMMAND_FORMATS[command_type] % args)
+                # Update internal state only from the board's answer
+                if command_type == self.CMD_SETALL: self.last_duty = args if success else None
+                elif command_type == self.CMD_FAN_SET and success:
                     with self.lock:
                         self.fan_speed = args
                         self.fan_enabled = args > 0
@@ -263,7 +345,7 @@ class BoardConnection:
              success = False; message = f"Execution Error: {e}"
 
         # Report result via GUI Queue
-        self.gui_queue.put(CommandComplete(board_idx, command_type, success, message))
+        self.gui_queue.append(CommandComplete(board_idx, command_type, success, message))
 
 
     def _start_command_processor(self):
@@ -279,7 +361,7 @@ class BoardConnection:
         if self.command_processor_thread and self.command_processor_thread.is_alive():
             # print(f"[{self.port}] Stopping command processor...") # Less verbose
             self.stop_event.set()
-            self.command_queue.put((None, None, None)) # Sentinel
+            self.command_queue.put((None, None, None, False)) # Sentinel
             self.command_processor_thread.join(timeout=1.5) # Shorter join timeout
             if self.command_processor_thread.is_alive(): print(f"[{self.port}] Warning: Cmd processor thread join timed out.")
             self.command_processor_thread = None
@@ -289,24 +371,27 @@ class BoardConnection:
         """Target function for the command processor thread."""
         while not self.stop_event.is_set():
             try:
-                command_type, args, board_idx = self.command_queue.get(timeout=0.2)
+                command_type, args, board_idx, force = self.command_queue.get(timeout=0.2)
                 if command_type is None: break
-                self._execute_command(command_type, args, board_idx)
+                self._execute_command(command_type, args, board_idx, force)
                 self.command_queue.task_done()
             except queue.Empty: continue
             except Exception as e:
                 print(f"[{self.port}] Error in command processor loop: {e}")
-                self.gui_queue.put(StatusUpdate(f"Cmd Proc Error ({self.port}): {e}", is_error=True))
+                self.gui_queue.append(StatusUpdate(f"Cmd Proc Error ({self.port}): {e}", is_error=True))
                 time.sleep(0.5)
         # print(f"[{self.port}] Command processor thread exiting.") # Less verbose
 
-    def queue_command(self, command_type, args, board_idx):
+    def queue_command(self, command_type, args, board_idx, force=False):
         """Adds a command to the processing queue."""
-        self.command_queue.put((command_type, args, board_idx))
+        self.command_queue.put((command_type, args, board_idx, force))
 
     # --- Public methods to queue commands ---
-    def send_led_command(self, duty_values, board_idx):
-        self.queue_command(self.CMD_SETALL, tuple(duty_values), board_idx)
+    def connect_command(self):
+        self.queue_command(self.CMD_CONNECT, None, None)
+
+    def send_led_command(self, duty_values, board_idx, force=False):
+        self.queue_command(self.CMD_SETALL, tuple(duty_values), board_idx, force)
 
     def set_fan_speed_command(self, percentage, board_idx):
         self.queue_command(self.CMD_FAN_SET, int(percentage), board_idx)
@@ -318,6 +403,13 @@ class BoardConnection:
     def turn_fan_off_command(self, board_idx):
         self.set_fan_speed_command(0, board_idx)
 
+    def set_port(self, port):
+        """Re-point at a new device path (board re-enumerated); reconnects on the next command."""
+        with self.lock:
+            if port == self.port: return
+            self._disconnect()
+            self.port = port
+
     def cleanup(self):
         """Clean up resources: stop processor, close port."""
         # print(f"[{self.port}] Initiating cleanup...") # Less verbose
@@ -334,17 +426,29 @@ class LEDControlGUI:
         self.root.title("SpecAC-HT Control System")
         self.root.geometry("1400x900")
 
-        self.gui_queue = queue.Queue()
+        self.gui_queue = collections.deque() # Workers append, Tk thread popleft()s; both are atomic
         self.queue_check_interval = TIMINGS['queue_check_interval']
+        self.gui_queue_timer = None # Single periodic tick: GUI queue + status bar
 
         self.background_operations = {}
+        # Shared pool for one-off background jobs (scan, import read, export write)
+        self.io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="GUI-IO")
+        self.io_futures = set() # Unfinished io_pool jobs, so on_closing can cancel queued ones
+        self.gui_action_handlers = { # Dispatch table for process_gui_queue, keyed by action class
+            StatusUpdate: self._on_status_update,
+            BoardsDetected: self._on_boards_detected,
+            CommandComplete: self._on_command_complete,
+            FileOperationComplete: self._on_file_operation_complete,
+            SettingsFileLoaded: self._on_settings_file_loaded,
+            SchedulerUpdate: self._on_scheduler_update,
+        }
 
         self.status_var = tk.StringVar(value="Initializing...")
 
         # --- Initialize Core Data Structures ---
         self.boards = []
         self.board_frames = []
-        self.led_entries = {}
+        self.board_led_vars = [] # Per-board IntVar tuples in LED_CHANNEL_NAMES order (bulk reads)
         self.chamber_to_board_idx = {}
         self.serial_to_board_idx = {}
         self.master_on = True
@@ -353,18 +457,24 @@ class LEDControlGUI:
         self.fan_speed_var = tk.StringVar(value="50")
         self.fan_button_var = tk.StringVar(value="Turn Fans ON") # **FIXED: Initialize fan_button_var**
         self.channel_schedules = {}
+        self.enabled_schedules = set() # (board_idx, channel_name) keys with scheduling enabled
         self.channel_time_entries = {}
         self.channel_schedule_vars = {}
         self.channel_schedule_frames = {}
         self.scheduler_running = False
         self.adaptive_check_timer = None
-        self.last_schedule_state = {}
+        self.last_schedule_state = {} # (board_idx, channel_name) -> last evaluated active bool
         self.scheduler_check_interval = TIMINGS['scheduler_default']
-        self.status_update_batch = []
-        self.status_update_timer = None
+        self.pending_apply_boards = set() # Board indices waiting for the coalesced apply
+        self.pending_apply_timer = None
+        self.pending_status = None # Latest status text only; flushed by the process_gui_queue tick
+        self.command_errors = [] # Failed-command messages collected until the GUI queue drains
+        self.command_successes = {} # Success text -> chambers, collected during one GUI queue pass
         self.chamber_mapping = {}
         self.reverse_chamber_mapping = {}
         self.current_page = 0
+        self.num_pages = 0 # Cached page count, refreshed whenever self.boards is rebuilt
+        self.page_labels = [] # Cached navigation label per page
         # self.boards_per_page is now accessed via self.board_layout
         # --- End Core Data Structures ---
 
@@ -382,7 +492,6 @@ class LEDControlGUI:
 
         # --- Initialize GUI ---
         self.create_gui()
-        self.initialize_port_cache() # Cache ports after GUI exists
         self.process_gui_queue() # Start queue processing
         self.scan_boards() # Start initial scan
         self.set_status("Ready.")
@@ -398,10 +507,15 @@ class LEDControlGUI:
         if hasattr(self, 'cached_fonts'):
             self.style.configure('Header.TLabel', font=self.cached_fonts['header'])
             self.style.configure('Subheader.TLabel', font=self.cached_fonts['subheader'])
+            # Per-channel board labels: font resolved once in the style, not per widget
+            self.style.configure('Unit.TLabel', font=self.cached_fonts['small'])
+            self.style.configure('ScheduleLabel.TLabel', font=self.cached_fonts['schedule_label'])
         else:
             print("Error: cached_fonts missing during setup_styles")
             self.style.configure('Header.TLabel', font=('Helvetica', 16, 'bold'))
             self.style.configure('Subheader.TLabel', font=('Helvetica', 12, 'bold'))
+            self.style.configure('Unit.TLabel', font=('Helvetica', 8, 'normal'))
+            self.style.configure('ScheduleLabel.TLabel', font=('Helvetica', 8, 'normal'))
 
         if hasattr(self, 'cached_colors'):
             self.style.configure('Success.TLabel', foreground=self.cached_colors['success'])
@@ -437,23 +551,6 @@ class LEDControlGUI:
             'time_hhmm': vcmd_time_hhmm
         }
 
-    def initialize_port_cache(self):
-        """Initialize the serial port cache"""
-        global CACHED_PORT_INFO, BOARD_SERIAL_CACHE
-        CACHED_PORT_INFO = {}
-        BOARD_SERIAL_CACHE = {}
-        try:
-            for port_info in list_ports.comports():
-                if port_info.vid == 0x2E8A and port_info.pid == 0x0005 and port_info.serial_number:
-                    CACHED_PORT_INFO[port_info.device] = {
-                        'serial_number': port_info.serial_number, 'description': port_info.description,
-                        'hwid': port_info.hwid, 'device': port_info.device
-                    }
-                    BOARD_SERIAL_CACHE[port_info.serial_number] = port_info.device
-        except Exception as e:
-            self.set_status(f"Error initializing port cache: {e}", is_error=True)
-            print(f"Error initializing port cache: {e}")
-
     def load_chamber_mapping(self):
         """Load the chamber to serial number mapping."""
         self.chamber_mapping = {}
@@ -529,17 +626,22 @@ class LEDControlGUI:
         # Page Container
         self.page_container = ttk.Frame(boards_area_frame)
         self.page_container.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        self.page_container.columnconfigure(0, weight=1)
+        self.page_container.rowconfigure(0, weight=1)
         self.page_frames = {}
+        self.displayed_page = None
         num_pages = (MAX_BOARDS + self.boards_per_page - 1) // self.boards_per_page
         cols_per_page = self.board_layout['cols_per_page']
         rows_per_page = self.board_layout['rows_per_page']
         for page_id in range(num_pages):
+            # Grid every page into the same slot once; page flips only map/unmap via grid()/grid_remove()
             page_frame = ttk.Frame(self.page_container)
-            page_frame.place(x=0, y=0, relwidth=1, relheight=1)
+            page_frame.grid(row=0, column=0, sticky="nsew")
+            page_frame.grid_remove()
             for c in range(cols_per_page): page_frame.columnconfigure(c, weight=1, minsize=180)
             for r in range(rows_per_page): page_frame.rowconfigure(r, weight=1, minsize=250)
             self.page_frames[page_id] = page_frame
-        if 0 in self.page_frames: self.page_frames[0].tkraise()
+        self.show_page(0)
 
         # --- Fan Control Frame ---
         fan_frame = ttk.LabelFrame(main_frame, text="Fan Controls")
@@ -572,8 +674,9 @@ class LEDControlGUI:
         if messagebox.askokcancel("Quit", "Quit application? This stops schedules and device control."):
             # Cancel timers
             if self.adaptive_check_timer: self.root.after_cancel(self.adaptive_check_timer)
-            if self.status_update_timer: self.root.after_cancel(self.status_update_timer)
-            self.adaptive_check_timer = None; self.status_update_timer = None
+            if self.gui_queue_timer: self.root.after_cancel(self.gui_queue_timer)
+            if self.pending_apply_timer: self.root.after_cancel(self.pending_apply_timer)
+            self.adaptive_check_timer = None; self.gui_queue_timer = None; self.pending_apply_timer = None
             self.scheduler_running = False
             # print("Timers cancelled, scheduler stopped.") # Less verbose
 
@@ -588,6 +691,9 @@ class LEDControlGUI:
             #     time.sleep(0.8) # Reduced wait # Removed
             # else: print("No boards connected.") # Less verbose
 
+            for future in list(self.io_futures): future.cancel() # Drop queued jobs; a running one finishes on its own
+            self.io_pool.shutdown(wait=False) # No cancel_futures: that needs Python 3.9
+
             # Cleanup connections (This will stop command processors and close ports)
             boards_to_cleanup = list(self.boards) # Copy list
             print(f"Cleaning up {len(boards_to_cleanup)} board connections...")
@@ -607,10 +713,7 @@ class LEDControlGUI:
 
     def next_page(self):
         """Navigate to the next page of chambers"""
-        num_boards_total = len(self.boards)
-        if num_boards_total == 0: return
-        num_pages = (num_boards_total + self.boards_per_page - 1) // self.boards_per_page
-        if self.current_page < num_pages - 1:
+        if self.current_page < self.num_pages - 1:
             self.current_page += 1
             self.update_page_display()
 
@@ -620,55 +723,61 @@ class LEDControlGUI:
             self.current_page -= 1
             self.update_page_display()
 
+    def show_page(self, page_id):
+        """Map the given page frame and unmap the others (grid_remove keeps their grid options)."""
+        if page_id == self.displayed_page or page_id not in self.page_frames: return
+        for pid, frame in self.page_frames.items():
+            if pid == page_id: frame.grid()
+            else: frame.grid_remove()
+        self.displayed_page = page_id
+
     def update_page_display(self):
         """Update the display to show the correct page of chambers"""
         num_boards_total = len(self.boards)
-        num_pages = 0
-        if num_boards_total > 0:
-            num_pages = (num_boards_total + self.boards_per_page - 1) // self.boards_per_page
+        num_pages = self.num_pages
 
         if num_boards_total == 0 or num_pages == 0:
              self.page_label.config(text="No Boards Found")
              self.prev_button.config(state=tk.DISABLED)
              self.next_button.config(state=tk.DISABLED)
-             if 0 in self.page_frames: self.page_frames[0].tkraise()
+             self.show_page(0)
              return
 
         if not (0 <= self.current_page < num_pages): self.current_page = 0
         current_page_idx = self.current_page
 
-        if current_page_idx in self.page_frames: self.page_frames[current_page_idx].tkraise()
+        if current_page_idx in self.page_frames: self.show_page(current_page_idx)
         else: print(f"Error: Page frame {current_page_idx} not found.")
 
-        start_board_idx = current_page_idx * self.boards_per_page
-        end_board_idx = min(start_board_idx + self.boards_per_page, num_boards_total)
-        try:
-            if 0 <= start_board_idx < num_boards_total and 0 <= end_board_idx -1 < num_boards_total:
-                 start_num = self.boards[start_board_idx].chamber_number or (start_board_idx + 1)
-                 end_num = self.boards[end_board_idx - 1].chamber_number or end_board_idx
-                 self.page_label.config(text=f"Chambers {start_num}-{end_num} (Page {current_page_idx + 1}/{num_pages})")
-            else: self.page_label.config(text=f"Page {current_page_idx + 1}/{num_pages}")
-        except IndexError: self.page_label.config(text=f"Page {current_page_idx + 1}/{num_pages}")
+        if current_page_idx < len(self.page_labels): self.page_label.config(text=self.page_labels[current_page_idx])
+        else: self.page_label.config(text=f"Page {current_page_idx + 1}/{num_pages}")
 
         self.prev_button.config(state=tk.NORMAL if current_page_idx > 0 else tk.DISABLED)
         self.next_button.config(state=tk.NORMAL if current_page_idx < num_pages - 1 else tk.DISABLED)
 
+    def build_page_labels(self):
+        """Precompute the navigation label for each page of the sorted board list."""
+        labels = []
+        num_boards_total = len(self.boards)
+        for page_idx in range(self.num_pages):
+            start_board_idx = page_idx * self.boards_per_page
+            end_board_idx = min(start_board_idx + self.boards_per_page, num_boards_total)
+            start_num = self.boards[start_board_idx].chamber_number or (start_board_idx + 1)
+            end_num = self.boards[end_board_idx - 1].chamber_number or end_board_idx
+            labels.append(f"Chambers {start_num}-{end_num} (Page {page_idx + 1}/{self.num_pages})")
+        return labels
+
     def create_board_frames(self):
         """Create frames for each detected board, optimized."""
-        # --- Clear existing elements ---
-        for frame in self.board_frames:
-            try: frame.destroy()
-            except tk.TclError: pass
-        self.board_frames = []
-        self.led_entries.clear(); self.channel_time_entries.clear()
-        self.channel_schedule_vars.clear(); self.channel_schedule_frames.clear()
-        self.chamber_to_board_idx.clear(); self.serial_to_board_idx.clear()
-        self.channel_schedules.clear(); self.last_schedule_state.clear()
+        self._reset_board_state() # Clear existing elements
+        self.num_pages = (len(self.boards) + self.boards_per_page - 1) // self.boards_per_page
+        self.page_labels = []
 
         if not self.boards:
             self.update_page_display(); return
 
         self.boards.sort(key=lambda b: b.chamber_number if b.chamber_number is not None else float('inf'))
+        self.page_labels = self.build_page_labels()
 
         # --- Pre-cache values used in the loop ---
         if not hasattr(self, 'widget_sizes') or not hasattr(self, 'board_layout'):
@@ -679,8 +788,6 @@ class LEDControlGUI:
         validate_percent_cmd = self.validation_commands['percentage']
         validate_time_cmd = self.validation_commands['time_hhmm']
         font_normal = self.cached_fonts['normal']
-        font_small = self.cached_fonts['small']
-        font_sched_label = self.cached_fonts['schedule_label']
         font_sched_entry = self.cached_fonts['schedule_entry']
         entry_width = self.widget_sizes['entry_width']
         time_entry_width = self.widget_sizes['time_entry_width']
@@ -701,7 +808,7 @@ class LEDControlGUI:
             if serial_num is not None: self.serial_to_board_idx[serial_num] = i
 
             page_id = i // boards_per_page
-            if page_id not in self.page_frames: continue
+            if page_id not in self.page_frames: self.board_led_vars.append(()); continue
 
             page_frame = self.page_frames[page_id]
             row_in_page = (i % boards_per_page) // cols_per_page
@@ -714,53 +821,57 @@ class LEDControlGUI:
             board_frame.columnconfigure(0, weight=1)
 
             self.channel_schedules[i] = {} # Initialize schedules
+            board_vars = []
 
             # --- Create LED Controls ---
-            for led_row, channel_name in enumerate(LED_CHANNEL_NAMES):
+            for led_row, (channel_name, _, color_bg) in enumerate(CHANNELS):
                 # Initialize internal schedule data
-                self.channel_schedules[i][channel_name] = {"on_time": default_on_time_internal, "off_time": default_off_time_internal, "enabled": False, "active": True}
-                sched_info = self.channel_schedules[i][channel_name]
+                self.channel_schedules[i][channel_name] = ChannelSchedule(default_on_time_internal, default_off_time_internal)
 
                 channel_frame = ttk.Frame(board_frame, padding=(5, 1))
                 channel_frame.grid(row=led_row, column=0, sticky="ew", pady=0)
                 channel_frame.columnconfigure(4, weight=1) # Spacer
 
                 # Widgets (using cached values)
-                color_bg = LED_COLORS.get(channel_name, "#CCCCCC")
                 tk.Frame(channel_frame, width=15, height=15, relief=tk.SUNKEN, borderwidth=1, bg=color_bg).grid(column=0, row=0, padx=(0, 5), sticky=tk.W)
                 ttk.Label(channel_frame, text=f"{channel_name}:", width=8, anchor=tk.W).grid(column=1, row=0, sticky=tk.W)
-                value_var = tk.StringVar(value="0")
+                value_var = tk.IntVar(value=0) # Read back as int; no per-read str->int parse
                 entry = ttk.Entry(channel_frame, width=entry_width, textvariable=value_var, validate='key', validatecommand=validate_percent_cmd, font=font_normal)
                 entry.grid(column=2, row=0, sticky=tk.W, padx=2)
-                self.led_entries[(i, channel_name)] = entry
-                ttk.Label(channel_frame, text="%", font=font_small).grid(column=3, row=0, sticky=tk.W, padx=(0, 10))
+                board_vars.append(value_var)
+                ttk.Label(channel_frame, text="%", style='Unit.TLabel').grid(column=3, row=0, sticky=tk.W, padx=(0, 10))
 
                 # Schedule Section Widgets
                 schedule_frame = ttk.Frame(channel_frame, style='ScheduleBase.TFrame')
                 schedule_frame.grid(column=5, row=0, sticky=tk.E, padx=(5,0))
                 self.channel_schedule_frames[(i, channel_name)] = schedule_frame
 
-                ttk.Label(schedule_frame, text="On:", font=font_sched_label).grid(column=0, row=0, padx=(5, 2), pady=1, sticky=tk.W)
-                on_time_var = tk.StringVar(value=default_on_time_hhmm)
-                on_time_entry = ttk.Entry(schedule_frame, width=time_entry_width, textvariable=on_time_var, font=font_sched_entry, validate='key', validatecommand=validate_time_cmd)
+                ttk.Label(schedule_frame, text="On:", style='ScheduleLabel.TLabel').grid(column=0, row=0, padx=(5, 2), pady=1, sticky=tk.W)
+                on_time_entry = ttk.Entry(schedule_frame, width=time_entry_width, font=font_sched_entry, validate='key', validatecommand=validate_time_cmd)
+                on_time_entry.insert(0, default_on_time_hhmm)
                 on_time_entry.grid(column=1, row=0, padx=(0, 5), pady=0)
                 self.channel_time_entries[(i, channel_name, "on")] = on_time_entry
-                on_time_var.trace_add("write", lambda n, idx, m, b=i, c=channel_name, v=on_time_var, e=on_time_entry: self.validate_time_entry_visual_hhmm(b, c, "on", v.get(), e))
+                # Visual check only when the edit is committed (focus out / Enter), not per keystroke
+                on_commit = partial(self.on_time_entry_commit, i, channel_name, "on")
+                on_time_entry.bind("<FocusOut>", on_commit); on_time_entry.bind("<Return>", on_commit)
 
-                ttk.Label(schedule_frame, text="Off:", font=font_sched_label).grid(column=0, row=1, padx=(5, 2), pady=1, sticky=tk.W)
-                off_time_var = tk.StringVar(value=default_off_time_hhmm)
-                off_time_entry = ttk.Entry(schedule_frame, width=time_entry_width, textvariable=off_time_var, font=font_sched_entry, validate='key', validatecommand=validate_time_cmd)
+                ttk.Label(schedule_frame, text="Off:", style='ScheduleLabel.TLabel').grid(column=0, row=1, padx=(5, 2), pady=1, sticky=tk.W)
+                off_time_entry = ttk.Entry(schedule_frame, width=time_entry_width, font=font_sched_entry, validate='key', validatecommand=validate_time_cmd)
+                off_time_entry.insert(0, default_off_time_hhmm)
                 off_time_entry.grid(column=1, row=1, padx=(0, 5), pady=0)
                 self.channel_time_entries[(i, channel_name, "off")] = off_time_entry
-                off_time_var.trace_add("write", lambda n, idx, m, b=i, c=channel_name, v=off_time_var, e=off_time_entry: self.validate_time_entry_visual_hhmm(b, c, "off", v.get(), e))
+                off_commit = partial(self.on_time_entry_commit, i, channel_name, "off")
+                off_time_entry.bind("<FocusOut>", off_commit); off_time_entry.bind("<Return>", off_commit)
 
                 schedule_var = tk.BooleanVar(value=False) # Default disabled
-                schedule_check = ttk.Checkbutton(schedule_frame, text="En", variable=schedule_var, command=lambda b=i, c=channel_name: self.update_channel_schedule(b, c))
+                schedule_check = ttk.Checkbutton(schedule_frame, text="En", variable=schedule_var, command=partial(self.update_channel_schedule, i, channel_name))
                 schedule_check.grid(column=2, row=0, rowspan=2, padx=(0, 5), pady=0, sticky=tk.W)
                 self.channel_schedule_vars[(i, channel_name)] = schedule_var
 
+            self.board_led_vars.append(tuple(board_vars))
+
             # Apply Button
-            apply_button = ttk.Button(board_frame, text="Apply", command=lambda b=i: self.apply_board_settings(b))
+            apply_button = ttk.Button(board_frame, text="Apply", command=partial(self.apply_board_settings, i))
             apply_button.grid(row=NUM_LED_CHANNELS, column=0, pady=(8, 4), sticky="ew")
 
         # --- Finalize ---
@@ -801,53 +912,54 @@ class LEDControlGUI:
         if not self.scheduler_running: self.toggle_scheduler()
 
     def schedule_check(self):
-        """Periodic scheduler check."""
+        """Scheduler check (Tk thread); re-arms the timer for the next transition."""
         if self.adaptive_check_timer: self.root.after_cancel(self.adaptive_check_timer)
         self.adaptive_check_timer = None
         if not self.scheduler_running: return
-        threading.Thread(target=self._schedule_check_worker, daemon=True, name="SchedulerCheck").start()
-        next_delay = max(50, self.scheduler_check_interval)
-        self.adaptive_check_timer = self.root.after(next_delay, self.schedule_check)
-
-    def _schedule_check_worker(self):
-        """Background worker for schedule checking."""
-        current_dt = datetime.now()
-        current_time_hhmm = current_dt.strftime("%H:%M")
+        try: self._run_schedule_check(datetime.now())
+        finally: self.adaptive_check_timer = self.root.after(self.scheduler_check_interval, self.schedule_check)
+
+    def _run_schedule_check(self, current_dt):
+        """Evaluate enabled channel schedules and queue updates for changed boards."""
+        if not self.enabled_schedules: # Nothing to evaluate; just resync occasionally
+            self.scheduler_check_interval = TIMINGS['scheduler_max']; return
+        curr_m = current_dt.hour * 60 + current_dt.minute
         min_diff = float('inf')
         boards_to_update = set()
         num_boards = len(self.boards)
-        # Iterate directly over indices present in the schedule dict
-        for board_idx in list(self.channel_schedules.keys()):
+        # Runs on the Tk thread, so the enabled set can be iterated without a snapshot
+        last_state = self.last_schedule_state
+        for cache_key in self.enabled_schedules:
+            board_idx, cn = cache_key
             if board_idx >= num_boards: continue # Check index validity
-            channels = self.channel_schedules.get(board_idx, {})
-            for cn, sched_info in channels.items():
-                if not sched_info.get("enabled"): continue
-                on_t = sched_info.get("on_time", ""); off_t = sched_info.get("off_time", "")
-                if not self.validate_internal_time_format(on_t) or not self.validate_internal_time_format(off_t): continue
-                try:
-                    on_h, on_m = map(int, on_t.split(':')); off_h, off_m = map(int, off_t.split(':'))
-                    curr_m = current_dt.hour * 60 + current_dt.minute
-                    on_mins = on_h * 60 + on_m; off_mins = off_h * 60 + off_m
-                    diff_on = (on_mins - curr_m + 1440) % 1440; diff_off = (off_mins - curr_m + 1440) % 1440
-                    min_diff = min(min_diff, diff_on, diff_off)
-                    active = self.is_time_between(current_time_hhmm, on_t, off_t)
-                    cache_key = (board_idx, cn)
-                    prev_active = self.last_schedule_state.get(cache_key, {}).get("active")
-                    if prev_active is None or prev_active != active:
-                        self.last_schedule_state[cache_key] = {"active": active, "last_check": current_dt}
-                        self.gui_queue.put(SchedulerUpdate(board_idx, cn, active))
-                        boards_to_update.add(board_idx)
-                except Exception as e: print(f"Err schedule {board_idx}-{cn}: {e}")
-        if boards_to_update: self.root.after(0, lambda b=list(boards_to_update): self.apply_settings_to_multiple_boards(b))
-        self.scheduler_check_interval = self.calculate_adaptive_interval(min_diff)
-
-    def calculate_adaptive_interval(self, min_time_diff_minutes):
-        """Calculate adaptive timer interval."""
-        if min_time_diff_minutes == float('inf'): return TIMINGS['scheduler_relaxed'] * 2
-        if min_time_diff_minutes <= 1: return TIMINGS['scheduler_urgent']
-        if min_time_diff_minutes <= 5: return TIMINGS['scheduler_normal'] // 2
-        if min_time_diff_minutes <= 15: return TIMINGS['scheduler_normal']
-        return TIMINGS['scheduler_relaxed']
+            sched_info = self.channel_schedules.get(board_idx, {}).get(cn)
+            if sched_info is None or not sched_info.enabled: continue
+            try:
+                on_mins = sched_info.on_min; off_mins = sched_info.off_min
+                diff_on = (on_mins - curr_m) % 1440 or 1440; diff_off = (off_mins - curr_m) % 1440 or 1440 # 0 = handled this pass
+                min_diff = min(min_diff, diff_on, diff_off)
+                active = bool(sched_info.active_minutes[curr_m])
+                if last_state.get(cache_key) is not active: # None (never seen) also counts as a change
+                    last_state[cache_key] = active
+                    self.gui_queue.append(SchedulerUpdate(board_idx, cn, active))
+                    boards_to_update.add(board_idx)
+            except Exception as e: print(f"Err schedule {board_idx}-{cn}: {e}")
+        if boards_to_update: self.queue_board_apply(boards_to_update)
+        self.scheduler_check_interval = self.ms_until_next_transition(min_diff, current_dt)
+
+    def ms_until_next_transition(self, min_time_diff_minutes, current_dt):
+        """Milliseconds until the minute boundary of the next ON/OFF transition (clamped)."""
+        if min_time_diff_minutes == float('inf'): return TIMINGS['scheduler_max']
+        seconds_into_minute = current_dt.second + current_dt.microsecond / 1e6
+        delay_ms = int((min_time_diff_minutes * 60 - seconds_into_minute) * 1000) + TIMINGS['scheduler_slack']
+        return max(TIMINGS['scheduler_min'], min(delay_ms, TIMINGS['scheduler_max']))
+
+    def submit_io(self, fn, *args):
+        """Run fn on the shared I/O pool, tracking the future until it finishes."""
+        future = self.io_pool.submit(fn, *args)
+        self.io_futures.add(future)
+        future.add_done_callback(self.io_futures.discard)
+        return future
 
     def scan_boards(self):
         """Detect and initialize connections to boards."""
@@ -855,52 +967,70 @@ class LEDControlGUI:
         # print("Starting board scan...") # Less verbose
         self.set_status(self.cmd_messages['scan_start'])
         self.background_operations['scan'] = True
-        threading.Thread(target=self._disconnect_all_boards_async, daemon=True).start()
+        # Snapshot on the Tk thread; the worker decides whether anything changed
+        self.submit_io(self._scan_boards_worker, list(self.boards))
 
-    def _disconnect_all_boards_async(self):
-        """Helper to disconnect all current boards."""
+    def _disconnect_boards(self, boards_to_disconnect):
+        """Helper to disconnect the given boards in parallel (worker thread)."""
         # print("Disconnecting existing boards...") # Less verbose
-        boards_to_disconnect = list(self.boards); self.boards = []
         threads = [threading.Thread(target=b.cleanup, name=f"Disc-{b.port}") for b in boards_to_disconnect]
         for t in threads: t.start()
         for t in threads: t.join(timeout=1.5) # Reduced timeout
-        self.root.after(0, self._clear_gui_elements)
-        self.root.after(10, self._start_scan_worker)
 
-    def _clear_gui_elements(self):
-        """Clears GUI elements related to boards."""
+    def _reset_board_state(self):
+        """Destroy board frames and drop all per-board state keyed by board index."""
         for frame in self.board_frames:
             try: frame.destroy()
             except tk.TclError: pass
-        self.board_frames = []; self.led_entries.clear(); self.channel_time_entries.clear()
+        self.board_frames = []; self.board_led_vars = []; self.channel_time_entries.clear()
         self.channel_schedule_vars.clear(); self.channel_schedule_frames.clear()
         self.chamber_to_board_idx.clear(); self.serial_to_board_idx.clear()
-        self.channel_schedules.clear(); self.last_schedule_state.clear()
+        self.channel_schedules.clear(); self.last_schedule_state.clear(); self.enabled_schedules.clear()
+        self.pending_apply_boards.clear() # Indices refer to the old board list
+
+    def _clear_gui_elements(self):
+        """Clears GUI elements related to boards."""
+        self._reset_board_state()
         self.master_on = True; self.master_button_var.set("All Lights OFF"); self.saved_values = {}
+        self.num_pages = 0; self.page_labels = []
         self.update_page_display()
 
-    def _start_scan_worker(self):
-        """Starts the background thread for scanning boards."""
-        threading.Thread(target=self._scan_boards_worker, daemon=True, name="BoardScan").start()
+    def _scan_boards_worker(self, existing_boards):
+        """Background worker thread for scanning boards.
 
-    def _scan_boards_worker(self):
-        """Background worker thread for scanning boards."""
-        boards_created = []; error_msg = None
+        Boards are matched by (serial, chamber). Boards still present keep their live
+        connection (re-pointed if the port path moved); only removed boards are
+        disconnected and only new ones get a BoardConnection. If nothing was added or
+        removed, the frames are kept too and no rebuild is requested.
+        """
+        error_msg = None; boards_found = []
         try:
             detected_info = self.detect_xiao_boards()
-            if detected_info:
-                for port, sn, cn in detected_info:
-                    if port and sn: boards_created.append(BoardConnection(port, sn, self.gui_queue, cn))
-            self.gui_queue.put(BoardsDetected(boards_created))
+            detected_ports = {(sn, cn): port for port, sn, cn in detected_info if port and sn}
+            existing_by_key = {(b.serial_number, b.chamber_number): b for b in existing_boards}
+            removed = [b for key, b in existing_by_key.items() if key not in detected_ports]
+            if removed: self._disconnect_boards(removed)
+            for key, port in detected_ports.items():
+                board = existing_by_key.get(key)
+                if board is not None: board.set_port(port)
+                else:
+                    board = BoardConnection(port, key[0], self.gui_queue, key[1])
+                    board.connect_command() # Open/settle now on the board's thread, not on first Apply
+                boards_found.append(board)
+            unchanged = detected_ports.keys() == existing_by_key.keys()
+            self.gui_queue.append(BoardsDetected(existing_boards if unchanged else boards_found, changed=not unchanged))
         except Exception as e:
             error_msg = f"Error during board scan: {e}"; print(f"Scan Worker Error: {error_msg}")
-            self.gui_queue.put(BoardsDetected([], error=error_msg))
+            self._disconnect_boards(existing_boards + [b for b in boards_found if b not in existing_boards])
+            self.gui_queue.append(BoardsDetected([], error=error_msg))
 
     def detect_xiao_boards(self):
         """Detect connected XIAO boards and assign chamber numbers."""
         results = []
-        try: ports_info = list_ports.comports()
-        except Exception as e: print(f"Error listing ports: {e}"); self.gui_queue.put(StatusUpdate(f"Error listing ports: {e}", True)); return []
+        try:
+            from serial.tools import list_ports # type: ignore # Platform backend loads on the scan thread, not at startup
+            ports_info = list_ports.comports()
+        except Exception as e: print(f"Error listing ports: {e}"); self.gui_queue.append(StatusUpdate(f"Error listing ports: {e}", True)); return []
         xiao_ports = [p for p in ports_info if p.vid == 0x2E8A and p.pid == 0x0005]
         temp_ids = set(); existing_chambers = set(self.chamber_mapping.values())
         for p_info in xiao_ports:
@@ -913,16 +1043,13 @@ class LEDControlGUI:
                 while temp_id in temp_ids or temp_id in existing_chambers: temp_id += 1
                 cn = temp_id; temp_ids.add(cn)
                 warn_msg += f" Assigned Temp ID {cn}"
-                self.gui_queue.put(StatusUpdate(warn_msg, True))
-            results.append([port, sn, cn])
+                self.gui_queue.append(StatusUpdate(warn_msg, True))
+            results.append((port, sn, cn))
         return results
 
     def validate_percentage(self, P):
         """Validation command for percentage entries (0-100)."""
-        if P == "": return True
-        try:
-            if 0 <= int(P) <= 100: return True
-        except ValueError: pass
+        if P == "" or (P.isdecimal() and len(P) <= 3 and int(P) <= 100): return True # No try/except on the reject path
         self.root.bell(); return False
 
     def validate_time_hhmm_format(self, P):
@@ -936,6 +1063,9 @@ class LEDControlGUI:
     def validate_internal_time_format(self, time_str_hhmm):
         """Validate internal HH:MM time format."""
         if not isinstance(time_str_hhmm, str): return False
+        if len(time_str_hhmm) == 5 and time_str_hhmm[2] == ':': # Canonical HH:MM fast path
+            hh, mm = time_str_hhmm[:2], time_str_hhmm[3:]
+            if hh.isdecimal() and mm.isdecimal(): return int(hh) <= 23 and int(mm) <= 59
         parts = time_str_hhmm.split(':')
         if len(parts) != 2: return False
         try: h, m = int(parts[0]), int(parts[1]); return 0 <= h <= 23 and 0 <= m <= 59
@@ -945,92 +1075,69 @@ class LEDControlGUI:
         """Apply current UI settings to all connected boards."""
         if not self.boards: messagebox.showwarning("No Boards", "No boards available."); return
         board_indices = list(range(len(self.boards)))
-        if not board_indices: return
-        if self.background_operations.get('apply_all'): self.set_status("Apply all already running..."); return
         self.set_status(self.cmd_messages['apply_start'] + f" to {len(board_indices)} boards...")
-        self.background_operations['apply_all'] = True
-        threading.Thread(target=self._apply_settings_to_multiple_worker, args=(list(board_indices), True), daemon=True, name="ApplyAll").start()
+        try:
+            queued = self._apply_settings_to_boards(board_indices)
+            self.set_status(f"Finished queuing settings for {queued}/{len(board_indices)} boards.")
+        except Exception as e:
+            print(f"Error applying settings: {e}"); self.set_status(f"Error applying settings: {e}", True)
 
-    def apply_settings_to_multiple_boards(self, board_indices):
+    def queue_board_apply(self, board_indices):
+        """Coalesce apply requests into one batch flushed from Tk's idle phase (main thread)."""
+        self.pending_apply_boards.update(board_indices)
+        if self.pending_apply_timer is None:
+            self.pending_apply_timer = self.root.after_idle(self._flush_pending_applies)
+
+    def _flush_pending_applies(self):
+        """Apply settings to every board queued since the last flush."""
+        self.pending_apply_timer = None
+        board_indices = sorted(self.pending_apply_boards); self.pending_apply_boards.clear()
+        if board_indices: self.apply_settings_to_multiple_boards(board_indices)
+
+    def apply_settings_to_multiple_boards(self, board_indices, force=False):
          """Helper to apply settings to a list of board indices."""
          valid_indices = [idx for idx in board_indices if 0 <= idx < len(self.boards)]
          if not valid_indices: return
          self.set_status(f"Applying settings to {len(valid_indices)} boards...")
-         threading.Thread(target=self._apply_settings_to_multiple_worker, args=(valid_indices, False), daemon=True, name=f"ApplySome").start()
-
-    def _apply_settings_to_multiple_worker(self, board_indices, is_apply_all):
-        """Background worker for applying settings."""
-        num_boards = len(board_indices); processed_count = 0
-        all_ui_percentages = {}; collect_result = {'data': {}, 'error': None, 'complete': False} # Store percentages now
-
-        # **MODIFIED: Collect percentages, not duty cycles**
-        def collect_batch_ui_data():
-            batch_data = {}
-            try:
-                for idx in board_indices:
-                    if idx >= len(self.boards): continue
-                    board_data = {cn: 0 for cn in LED_CHANNEL_NAMES} # Pre-fill with 0 percentages
-                    for channel_name in LED_CHANNEL_NAMES:
-                        entry = self.led_entries.get((idx, channel_name))
-                        if entry:
-                             try:
-                                  if entry.winfo_exists():
-                                       val = int(entry.get())
-                                       if 0 <= val <= 100: board_data[channel_name] = val # Store percentage
-                             except (ValueError, tk.TclError): pass
-                    batch_data[idx] = board_data
-                collect_result['data'] = batch_data
-            except Exception as e: collect_result['error'] = f"Error collecting UI data: {e}"
-            finally: collect_result['complete'] = True
-        self.root.after(0, collect_batch_ui_data)
-        timeout = time.time() + 2.0 # Shorter timeout
-        while not collect_result['complete'] and time.time() < timeout: time.sleep(0.01)
-        if not collect_result['complete'] or collect_result['error']:
-             error_msg = collect_result['error'] or "Timeout collecting UI data."
-             print(f"Apply Worker Error: {error_msg}")
-             self.gui_queue.put(StatusUpdate(error_msg, is_error=True))
-             if is_apply_all: self.root.after(0, lambda: self.background_operations.pop('apply_all', None))
-             return
-        all_ui_percentages = collect_result['data'] # Now holds percentages
-
-        try:
-            current_time_hhmm = datetime.now().strftime("%H:%M")
-            for board_idx in board_indices:
-                if board_idx not in all_ui_percentages or board_idx >= len(self.boards): continue
-                board = self.boards[board_idx]
-                ui_percentages = all_ui_percentages[board_idx] # Get collected percentages
-                final_duties = list(ZERO_DUTY_CYCLES)
-                for channel_idx, channel_name in enumerate(LED_CHANNEL_NAMES):
-                    sched_info = self.channel_schedules.get(board_idx, {}).get(channel_name, {})
-                    apply_ui_value = True # Default
-                    if sched_info.get("enabled"):
-                        on_t = sched_info.get("on_time", ""); off_t = sched_info.get("off_time", "")
-                        if self.validate_internal_time_format(on_t) and self.validate_internal_time_format(off_t):
-                            if not self.is_time_between(current_time_hhmm, on_t, off_t):
-                                apply_ui_value = False # Scheduled OFF
-                    if apply_ui_value:
-                        percentage = ui_percentages.get(channel_name, 0) # Get percentage
-                        final_duties[channel_idx] = self.duty_cycle_from_percentage(percentage) # Convert here
-                    # else: final_duties remains 0
-
-                board.send_led_command(final_duties, board_idx)
-                processed_count += 1
-                time.sleep(TIMINGS['apply_batch_delay'])
-        except Exception as e:
-             print(f"Error in apply worker loop: {e}")
-             self.gui_queue.put(StatusUpdate(f"Error applying settings: {e}", True))
-        finally:
-            if is_apply_all:
-                 self.root.after(0, lambda: self.background_operations.pop('apply_all', None))
-                 final_msg = f"Finished queuing settings for {processed_count}/{num_boards} boards."
-                 self.gui_queue.put(StatusUpdate(final_msg))
+         try: self._apply_settings_to_boards(valid_indices, force)
+         except Exception as e:
+              print(f"Error applying settings: {e}"); self.set_status(f"Error applying settings: {e}", True)
+
+    def _apply_settings_to_boards(self, board_indices, force=False):
+        """Read UI percentages and queue one SETALL per board; returns the number queued.
+
+        Runs on the Tk thread. It only reads Tcl variables and appends to each board's
+        command queue; the serial round trips happen on the boards' own threads. Boards
+        skip values they already acknowledged unless force is set.
+        """
+        board_led_vars = self.board_led_vars
+        valid = [idx for idx in board_indices if idx < len(self.boards) and idx < len(board_led_vars)]
+        # Read every requested IntVar in one Tcl call instead of one var.get() round trip each
+        names = [str(var) for idx in valid for var in board_led_vars[idx]]
+        raw = self.root.tk.splitlist(self.root.tk.eval("list " + " ".join(f"[set {n}]" for n in names))) if names else ()
+        now = datetime.now(); curr_m = now.hour * 60 + now.minute
+        duty_lookup = DUTY_CYCLE_LOOKUP
+        pos = 0; queued = 0
+        for board_idx in valid:
+            n_vars = len(board_led_vars[board_idx])
+            values = raw[pos:pos + n_vars]; pos += n_vars
+            final_duties = list(ZERO_DUTY_CYCLES)
+            board_sched = self.channel_schedules.get(board_idx, {}) # One lookup per board
+            for channel_idx, (channel_name, val) in enumerate(zip(LED_CHANNEL_NAMES, values)):
+                if not (val.isdecimal() and int(val) <= 100): continue # Empty/invalid entry sends 0
+                sched_info = board_sched.get(channel_name)
+                if sched_info and sched_info.enabled and not sched_info.active_minutes[curr_m]: continue # Scheduled OFF
+                final_duties[channel_idx] = duty_lookup[int(val)]
+            self.boards[board_idx].send_led_command(final_duties, board_idx, force)
+            queued += 1 # Each board's own CmdProc thread writes; ports run concurrently
+        return queued
 
     def apply_board_settings(self, board_idx):
         """Apply settings for a specific board (called by button)."""
         if board_idx >= len(self.boards): messagebox.showerror("Error", f"Invalid board index: {board_idx}"); return
         chamber = self.boards[board_idx].chamber_number or (board_idx + 1)
         self.set_status(f"Applying settings to Chamber {chamber}...")
-        self.apply_settings_to_multiple_boards([board_idx])
+        self.apply_settings_to_multiple_boards([board_idx], force=True) # Explicit per-board Apply always re-sends
 
     def toggle_all_fans(self):
         """Toggle all fans on or off."""
@@ -1062,6 +1169,7 @@ class LEDControlGUI:
     def export_settings(self):
         """Export current settings to a JSON file"""
         if not self.boards: messagebox.showwarning("No Boards", "No boards to export."); return
+        from tkinter import filedialog
         f_path = filedialog.asksaveasfilename(initialdir=DEFAULT_DOCUMENTS_PATH, defaultextension=".json", filetypes=[("JSON files", "*.json")], title="Save Settings")
         if not f_path: self.set_status("Export cancelled."); return
         self.set_status(self.cmd_messages['export_start'])
@@ -1072,58 +1180,63 @@ class LEDControlGUI:
                 b_data = {"intensity": {}, "schedule": {}, "fan": {"enabled": board.fan_enabled, "speed": board.fan_speed}}
                 s_data = {}
                 b_sched = self.channel_schedules.get(idx, {})
-                for cn in LED_CHANNEL_NAMES:
+                b_vars = self.board_led_vars[idx] if idx < len(self.board_led_vars) else ()
+                for ch_idx, cn in enumerate(LED_CHANNEL_NAMES):
                     intensity = 0; on_t = "08:00"; off_t = "00:00"; enabled = False
-                    entry = self.led_entries.get((idx, cn))
-                    if entry:
-                        try:
-                            if entry.winfo_exists(): intensity = int(entry.get())
-                        except (ValueError, tk.TclError): pass
+                    if ch_idx < len(b_vars): # Raw entry text, parsed like apply does (IntVar.get() reads "050" as octal)
+                        raw = str(self.root.globalgetvar(str(b_vars[ch_idx])))
+                        if raw.isdecimal(): intensity = int(raw)
                     b_data["intensity"][cn] = max(0, min(100, intensity))
-                    s_info = b_sched.get(cn, {})
-                    on_t = s_info.get("on_time", on_t); off_t = s_info.get("off_time", off_t)
-                    enabled = s_info.get("enabled", enabled)
+                    s_info = b_sched.get(cn)
+                    if s_info: on_t = s_info.on_time; off_t = s_info.off_time; enabled = s_info.enabled
                     # Read directly from internal state for export consistency
                     s_data[cn] = {"on_time": on_t, "off_time": off_t, "enabled": bool(enabled)}
                 b_data["schedule"] = s_data
                 settings[key] = b_data
         except Exception as e:
             err = f"Error collecting settings: {e}"; print(f"Export Error: {err}")
-            self.gui_queue.put(FileOperationComplete('export', False, err)); return
-        threading.Thread(target=self._export_settings_worker, args=(f_path, settings), daemon=True).start()
+            self.gui_queue.append(FileOperationComplete('export', False, err)); return
+        self.submit_io(self._export_settings_worker, f_path, settings)
 
     def _export_settings_worker(self, file_path, settings_data):
         """Background worker for saving exported settings."""
         error = None
         try:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w') as f: json.dump(settings_data, f, indent=4, sort_keys=True)
+            # Serialize up front and write once (json.dump writes token by token)
+            if orjson is not None: data = orjson.dumps(settings_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            else: data = json.dumps(settings_data, indent=2, sort_keys=True).encode('utf-8')
+            with open(file_path, 'wb') as f: f.write(data)
         except Exception as e: error = f"Error writing file: {e}"
-        if error: print(f"Export error: {error}"); self.gui_queue.put(FileOperationComplete('export', False, error))
-        else: self.gui_queue.put(FileOperationComplete('export', True, file_path))
+        if error: print(f"Export error: {error}"); self.gui_queue.append(FileOperationComplete('export', False, error))
+        else: self.gui_queue.append(FileOperationComplete('export', True, file_path))
 
     def import_settings(self):
         """Import settings from a JSON file"""
+        from tkinter import filedialog
         f_path = filedialog.askopenfilename(initialdir=DEFAULT_DOCUMENTS_PATH, filetypes=[("JSON files", "*.json")], title="Import Settings")
         if not f_path: self.set_status("Import cancelled."); return
         self.set_status(self.cmd_messages['import_start'])
-        threading.Thread(target=self._import_settings_reader_worker, args=(f_path,), daemon=True).start()
+        self.submit_io(self._import_settings_reader_worker, f_path)
 
     def _import_settings_reader_worker(self, file_path):
          """Background worker for reading the import file."""
          settings = None; error = None
          try:
-             with open(file_path, 'r') as f: settings = json.load(f)
+             if orjson is not None:
+                 with open(file_path, 'rb') as f: settings = orjson.loads(f.read())
+             else:
+                 with open(file_path, 'r') as f: settings = json.load(f)
              if not isinstance(settings, dict): raise ValueError("Invalid format")
          except FileNotFoundError: error = f"File not found: {os.path.basename(file_path)}"
          except json.JSONDecodeError as e: error = f"Invalid JSON: {e}"
          except Exception as e: error = f"Error reading file: {e}"
-         if error: print(f"Import error: {error}"); self.gui_queue.put(FileOperationComplete('import', False, error))
-         else: self.root.after(0, lambda d=settings, p=file_path: self._apply_imported_settings_to_ui(d, p))
+         if error: print(f"Import error: {error}"); self.gui_queue.append(FileOperationComplete('import', False, error))
+         else: self.gui_queue.append(SettingsFileLoaded(settings, file_path)) # Tk calls stay on the main thread
 
     def _apply_imported_settings_to_ui(self, imported_settings, file_path):
         """Applies loaded settings to the UI (main thread)."""
-        if not self.boards: self.gui_queue.put(FileOperationComplete('import', False, "No boards.")); return
+        if not self.boards: self.gui_queue.append(FileOperationComplete('import', False, "No boards.")); return
         applied = 0; skipped = set(); fan_found = False; error = None; fan_ui_updated = False
         try:
             for key, cfg in imported_settings.items():
@@ -1133,28 +1246,33 @@ class LEDControlGUI:
                 board = self.boards[idx]
                 # Intensity
                 if "intensity" in cfg and isinstance(cfg["intensity"], dict):
+                    b_vars = self.board_led_vars[idx] if idx < len(self.board_led_vars) else ()
                     for cn, val in cfg["intensity"].items():
-                        if cn in LED_CHANNELS:
-                            entry = self.led_entries.get((idx, cn))
-                            if entry:
-                                try:
-                                    p_val = int(val)
-                                    if 0 <= p_val <= 100 and entry.winfo_exists(): entry.delete(0, tk.END); entry.insert(0, str(p_val)); applied += 1
-                                except (ValueError, tk.TclError): pass
+                        ch_idx = LED_CHANNELS.get(cn)
+                        if ch_idx is not None and ch_idx < len(b_vars):
+                            try:
+                                p_val = int(val)
+                                if 0 <= p_val <= 100: b_vars[ch_idx].set(p_val); applied += 1
+                            except (ValueError, TypeError, tk.TclError): pass
                 # Schedule
                 if "schedule" in cfg and isinstance(cfg["schedule"], dict):
-                     if idx not in self.channel_schedules: self.channel_schedules[idx] = {}
+                     b_scheds = self.channel_schedules.setdefault(idx, {})
                      for cn, chan_sched in cfg["schedule"].items():
                           if cn in LED_CHANNELS and isinstance(chan_sched, dict):
                                on_t = chan_sched.get("on_time", "08:00"); off_t = chan_sched.get("off_time", "00:00"); en = bool(chan_sched.get("enabled", False))
                                if not self.validate_internal_time_format(on_t): on_t = "08:00"
                                if not self.validate_internal_time_format(off_t): off_t = "00:00"
-                               self.channel_schedules.setdefault(idx, {}).setdefault(cn, {}).update({"on_time": on_t, "off_time": off_t, "enabled": en})
+                               sched = b_scheds.get(cn)
+                               if sched is None: sched = b_scheds[cn] = ChannelSchedule()
+                               sched.set_times(on_t, off_t); sched.enabled = en
+                               if en: self.enabled_schedules.add((idx, cn))
+                               else: self.enabled_schedules.discard((idx, cn))
                                on_t_ui = on_t.replace(":", ""); off_t_ui = off_t.replace(":", "")
                                on_e=self.channel_time_entries.get((idx,cn,"on")); off_e=self.channel_time_entries.get((idx,cn,"off")); en_v=self.channel_schedule_vars.get((idx,cn))
                                try:
-                                    if on_e and on_e.winfo_exists(): on_e.delete(0, tk.END); on_e.insert(0, on_t_ui)
-                                    if off_e and off_e.winfo_exists(): off_e.delete(0, tk.END); off_e.insert(0, off_t_ui)
+                                    # Widgets belong to the current board set; a destroyed one raises TclError below
+                                    if on_e: on_e.delete(0, tk.END); on_e.insert(0, on_t_ui); self.validate_time_entry_visual_hhmm(idx, cn, "on", on_t_ui, on_e)
+                                    if off_e: off_e.delete(0, tk.END); off_e.insert(0, off_t_ui); self.validate_time_entry_visual_hhmm(idx, cn, "off", off_t_ui, off_e)
                                     if en_v: en_v.set(en)
                                     applied += 1
                                except tk.TclError: pass
@@ -1172,64 +1290,52 @@ class LEDControlGUI:
                      except (ValueError, tk.TclError): pass
         except Exception as e: error = f"Error applying settings to UI: {e}"; print(f"Import Apply Error: {error}")
         # --- Send Result ---
-        if error: self.gui_queue.put(FileOperationComplete('import', False, error))
+        if error: self.gui_queue.append(FileOperationComplete('import', False, error))
         else:
              msg = f"Applied {applied} settings from {os.path.basename(file_path)}."
              if skipped: msg += f" Skipped: {', '.join(skipped)}."
              data = {'applied_count': applied, 'fan_settings_found': fan_found}
-             self.gui_queue.put(FileOperationComplete('import', True, msg, data))
-
-    def validate_time_hhmm_format(self, P):
-        """Validation command for HHMM time entries."""
-        if P == "": return True
-        if len(P) <= 4 and bool(TIME_PATTERN.match(P.ljust(4, '0'))):
-             if len(P) == 4: return bool(TIME_PATTERN.match(P))
-             return True # Allow partial
-        self.root.bell(); return False
-
-    def validate_internal_time_format(self, time_str_hhmm):
-        """Validate internal HH:MM time format."""
-        if not isinstance(time_str_hhmm, str): return False
-        parts = time_str_hhmm.split(':')
-        if len(parts) != 2: return False
-        try: h, m = int(parts[0]), int(parts[1]); return 0 <= h <= 23 and 0 <= m <= 59
-        except ValueError: return False
+             self.gui_queue.append(FileOperationComplete('import', True, msg, data))
+             if self.scheduler_running: self.schedule_check() # Imported schedules may move the next transition
 
     def validate_time_entry_visual_hhmm(self, board_idx, channel_name, entry_type, new_value_hhmm, entry_widget):
-        """Visual validation for HHMM time entries."""
-        try:
-            if entry_widget.winfo_exists():
-                is_valid = self.validate_time_hhmm_format(new_value_hhmm)
-                color = self.cached_colors['normal'] if is_valid else self.cached_colors['error']
-                entry_widget.config(foreground=color)
+        """Visual validation for a committed HHMM time entry (partial input shows as invalid)."""
+        is_valid = bool(TIME_PATTERN.match(new_value_hhmm))
+        color = self.cached_colors['normal'] if is_valid else self.cached_colors['error']
+        try: entry_widget.config(foreground=color)
         except tk.TclError: pass # Widget destroyed
 
+    def on_time_entry_commit(self, board_idx, channel_name, entry_type, event):
+        """<FocusOut>/<Return> handler for schedule time entries."""
+        entry_widget = event.widget
+        try: value = entry_widget.get()
+        except tk.TclError: return # Widget destroyed
+        self.validate_time_entry_visual_hhmm(board_idx, channel_name, entry_type, value, entry_widget)
+
     def set_status(self, message, is_error=False):
-        """Update status bar using batched updates."""
-        self.status_update_batch.append({'message': message, 'is_error': is_error})
-        if not self.status_update_timer:
-            try: self.status_update_timer = self.root.after(TIMINGS['status_update_batch'], self.process_status_updates)
-            except tk.TclError: pass # Root destroyed
+        """Update status bar using batched updates (flushed on the next GUI queue tick)."""
+        self.pending_status = f"Error: {message}" if is_error else message # Older pending text is superseded
+        if self.gui_queue_timer and self.queue_check_interval > TIMINGS['queue_check_interval']:
+            # Poll is backed off and idle; user activity brings it back to the fast rate now
+            self.root.after_cancel(self.gui_queue_timer)
+            self.queue_check_interval = TIMINGS['queue_check_interval']
+            self.gui_queue_timer = self.root.after(self.queue_check_interval, self.process_gui_queue)
 
     def process_status_updates(self):
         """Process batched status updates."""
-        self.status_update_timer = None
-        if not self.status_update_batch: return
-        latest = self.status_update_batch[-1]
-        msg = latest['message']; is_err = latest['is_error']
-        try:
-             if self.status_bar_widget.winfo_exists():
-                 status_text = f"Error: {msg}" if is_err else msg
-                 self.status_var.set(status_text[:200]) # Limit status length
+        status_text = self.pending_status
+        if status_text is None: return
+        self.pending_status = None
+        try: self.status_var.set(status_text[:200]) # Limit status length
         except tk.TclError: pass
         except Exception as e: print(f"Error updating status bar: {e}")
-        self.status_update_batch = []
 
     def update_channel_schedule(self, board_idx, channel_name):
         """Update schedule state when checkbox is toggled."""
         if board_idx >= len(self.boards): return
-        self.channel_schedules.setdefault(board_idx, {}).setdefault(channel_name, {"on_time": "08:00", "off_time": "00:00", "enabled": False, "active": True})
-        sched_info = self.channel_schedules[board_idx][channel_name]
+        b_scheds = self.channel_schedules.setdefault(board_idx, {})
+        sched_info = b_scheds.get(channel_name)
+        if sched_info is None: sched_info = b_scheds[channel_name] = ChannelSchedule()
         sched_var = self.channel_schedule_vars.get((board_idx, channel_name))
         on_entry = self.channel_time_entries.get((board_idx, channel_name, "on"))
         off_entry = self.channel_time_entries.get((board_idx, channel_name, "off"))
@@ -1237,9 +1343,9 @@ class LEDControlGUI:
 
         try:
             is_enabled = sched_var.get()
-            on_t_ui = on_entry.get() if on_entry and on_entry.winfo_exists() else sched_info["on_time"].replace(":", "")
-            off_t_ui = off_entry.get() if off_entry and off_entry.winfo_exists() else sched_info["off_time"].replace(":", "")
-            on_valid = self.validate_time_hhmm_format(on_t_ui); off_valid = self.validate_time_hhmm_format(off_t_ui)
+            on_t_ui = on_entry.get() if on_entry and on_entry.winfo_exists() else sched_info.on_time.replace(":", "")
+            off_t_ui = off_entry.get() if off_entry and off_entry.winfo_exists() else sched_info.off_time.replace(":", "")
+            on_valid = bool(TIME_PATTERN.match(on_t_ui)); off_valid = bool(TIME_PATTERN.match(off_t_ui)) # Full HHMM only
 
             if is_enabled and (not on_valid or not off_valid):
                 messagebox.showerror("Invalid Time", f"Cannot enable schedule for {channel_name} with invalid time (HHMM).")
@@ -1249,97 +1355,111 @@ class LEDControlGUI:
                 on_t_hhmm = f"{on_t_ui[:2]}:{on_t_ui[2:]}"; off_t_hhmm = f"{off_t_ui[:2]}:{off_t_ui[2:]}"
             else: on_t_hhmm = "08:00"; off_t_hhmm = "00:00" # Reset if disabled or invalid
 
-            sched_info["on_time"] = on_t_hhmm; sched_info["off_time"] = off_t_hhmm; sched_info["enabled"] = is_enabled
+            sched_info.set_times(on_t_hhmm, off_t_hhmm); sched_info.enabled = is_enabled
+            if is_enabled: self.enabled_schedules.add((board_idx, channel_name))
+            else: self.enabled_schedules.discard((board_idx, channel_name))
             chamber = self.boards[board_idx].chamber_number or (board_idx + 1)
             action = "enabled" if is_enabled else "disabled"
             self.set_status(f"Schedule {action} for {chamber}-{channel_name}")
-            self.root.after(10, lambda idx=board_idx: self.apply_board_settings(idx))
+            self.queue_board_apply((board_idx,)) # Rapid checkbox toggles coalesce into one apply
+            if self.scheduler_running: self.schedule_check() # Re-plan the wait for the edited schedule
         except tk.TclError: print(f"Warn: Widget error updating schedule {board_idx}-{channel_name}")
         except Exception as e: print(f"Error updating schedule {board_idx}-{channel_name}: {e}")
 
-    def is_time_between(self, check_time_str, start_time_str_hhmm, end_time_str_hhmm):
-        """Check if check_time (HH:MM) is between start/end (HH:MM) (exclusive end)."""
-        try:
-            ch, cm = map(int, check_time_str.split(':')); check_m = ch * 60 + cm
-            sh, sm = map(int, start_time_str_hhmm.split(':')); start_m = sh * 60 + sm
-            eh, em = map(int, end_time_str_hhmm.split(':')); end_m = eh * 60 + em
-            if start_m == end_m: return True # Assume 24h if same
-            if start_m < end_m: return start_m <= check_m < end_m # Normal interval
-            else: return check_m >= start_m or check_m < end_m # Wraparound interval
-        except: return False # Invalid format -> False
+    def _on_status_update(self, action):
+        """Forward a worker status message to the status bar."""
+        self.set_status(action.message, action.is_error)
+
+    def _on_boards_detected(self, action):
+        """Finish a board scan; rebuild frames only if the board set changed."""
+        self.background_operations.pop('scan', None) # Clear scan flag
+        if action.changed or action.error:
+            self._clear_gui_elements()
+            self.boards = action.boards if not action.error else []
+            if action.error: messagebox.showerror("Scan Error", action.error); self.set_status(f"Scan Error: {action.error}", True)
+            self.create_board_frames() # Recreate GUI
+        if not action.error: self.set_status(f"Scan complete: Found {len(self.boards)} board(s).")
+
+    def _on_command_complete(self, action):
+        """Report the result of a board command."""
+        if action.board_idx >= len(self.boards): return
+        chamber = self.boards[action.board_idx].chamber_number or (action.board_idx + 1)
+        prefix = f"Chamber {chamber}:"
+        if action.success:
+            if action.command_type == BoardConnection.CMD_SETALL:
+                msg = "LEDs already set." if action.message == BoardConnection.MSG_UNCHANGED else "LEDs updated."
+            elif action.command_type == BoardConnection.CMD_FAN_SET: msg = "Fan updated."
+            else: msg = f"{action.command_type} OK."
+            if action.extra_info: msg += f" ({action.extra_info})"
+            self.command_successes.setdefault(msg, []).append(chamber) # Summarised once this queue pass is drained
+        else:
+            err_msg = f"{prefix} {action.command_type} Error - {action.message}"
+            self.command_errors.append(err_msg) # Shown together once the GUI queue is drained
+            self.set_status(err_msg, True)
+
+    def _on_file_operation_complete(self, action):
+        """Report an import/export result."""
+        op = action.operation_type.capitalize()
+        if action.success:
+            if action.operation_type == 'import':
+                self.set_status(f"Import successful: {action.message}")
+                if action.data and action.data['applied_count'] > 0:
+                    apply_q = f"Loaded/Applied {action.data['applied_count']} settings to interface.\nSend to boards now?"
+                    if action.data.get('fan_settings_found'): apply_q += "\n(Fan settings included.)"
+                    if messagebox.askyesno("Send Imported Settings", apply_q):
+                         self.apply_all_settings()
+                         if action.data.get('fan_settings_found'): self.apply_fan_settings()
+            elif action.operation_type == 'export':
+                 self.set_status(f"Exported to {os.path.basename(action.message)}")
+                 messagebox.showinfo("Export Successful", f"Settings exported to:\n{action.message}")
+        else: # Error
+            messagebox.showerror(f"{op} Error", f"Error: {action.message}")
+            self.set_status(f"{op} error: {action.message}", True)
+
+    def _on_scheduler_update(self, action):
+        """Reflect a schedule on/off transition in the channel frame."""
+        idx, cn, active = action.board_idx, action.channel_name, action.active
+        if idx in self.channel_schedules and cn in self.channel_schedules[idx]:
+            self.channel_schedules[idx][cn].active = active
+            frame = self.channel_schedule_frames.get((idx, cn))
+            if frame:
+                 try:
+                      if frame.winfo_exists():
+                           target_style = 'ActiveSchedule.TFrame' if active else 'InactiveSchedule.TFrame'
+                           frame.config(style=target_style)
+                 except tk.TclError: pass
+
+    def _on_settings_file_loaded(self, action):
+        """Hand a parsed import file from the reader thread to the UI."""
+        self._apply_imported_settings_to_ui(action.settings, action.file_path)
 
     def process_gui_queue(self):
         """Process GUI action queue."""
+        self.gui_queue_timer = None # This tick is running; set_status must not re-arm it
+        handlers = self.gui_action_handlers
         processed = 0
         try:
-            for _ in range(50): # Limit items per cycle
-                action = self.gui_queue.get_nowait()
+            while self.gui_queue and processed < 50: # Limit items per cycle
+                action = self.gui_queue.popleft()
                 processed += 1
-                # --- Handle Actions ---
-                if isinstance(action, StatusUpdate): self.set_status(action.message, action.is_error)
-                elif isinstance(action, BoardsDetected):
-                    self.background_operations.pop('scan', None) # Clear scan flag
-                    self.boards = action.boards if not action.error else []
-                    if action.error: messagebox.showerror("Scan Error", action.error); self.set_status(f"Scan Error: {action.error}", True)
-                    self.create_board_frames() # Recreate GUI
-                    if not action.error: self.set_status(f"Scan complete: Found {len(self.boards)} board(s).")
-                elif isinstance(action, CommandComplete):
-                    if action.board_idx >= len(self.boards): continue
-                    chamber = self.boards[action.board_idx].chamber_number or (action.board_idx + 1)
-                    prefix = f"Chamber {chamber}:"
-                    if action.success:
-                        msg = f"{prefix} "
-                        if action.command_type == BoardConnection.CMD_SETALL: msg += "LEDs updated."
-                        elif action.command_type == BoardConnection.CMD_FAN_SET: msg += "Fan updated."
-                        else: msg += f"{action.command_type} OK."
-                        if action.extra_info: msg += f" ({action.extra_info})"
-                        self.set_status(msg)
-                    else:
-                        err_msg = f"{prefix} {action.command_type} Error - {action.message}"
-                        messagebox.showerror(f"Command Error ({prefix})", f"Cmd: {action.command_type}\nError: {action.message}")
-                        self.set_status(err_msg, True)
-                elif isinstance(action, FileOperationComplete):
-                    op = action.operation_type.capitalize()
-                    if action.success:
-                        if action.operation_type == 'import':
-                            self.set_status(f"Import successful: {action.message}")
-                            if action.data and action.data['applied_count'] > 0:
-                                apply_q = f"Loaded/Applied {action.data['applied_count']} settings to interface.\nSend to boards now?"
-                                if action.data.get('fan_settings_found'): apply_q += "\n(Fan settings included.)"
-                                if messagebox.askyesno("Send Imported Settings", apply_q):
-                                     self.apply_all_settings()
-                                     if action.data.get('fan_settings_found'): self.apply_fan_settings()
-                        elif action.operation_type == 'export':
-                             self.set_status(f"Exported to {os.path.basename(action.message)}")
-                             messagebox.showinfo("Export Successful", f"Settings exported to:\n{action.message}")
-                    else: # Error
-                        messagebox.showerror(f"{op} Error", f"Error: {action.message}")
-                        self.set_status(f"{op} error: {action.message}", True)
-                elif isinstance(action, SchedulerUpdate):
-                    idx, cn, active = action.board_idx, action.channel_name, action.active
-                    if idx in self.channel_schedules and cn in self.channel_schedules[idx]:
-                        self.channel_schedules[idx][cn]['active'] = active
-                        frame = self.channel_schedule_frames.get((idx, cn))
-                        if frame:
-                             try:
-                                  if frame.winfo_exists():
-                                       target_style = 'ActiveSchedule.TFrame' if active else 'InactiveSchedule.TFrame'
-                                       frame.config(style=target_style)
-                             except tk.TclError: pass
-                # --- End Handle Actions ---
-                self.gui_queue.task_done()
-        except queue.Empty: pass
+                handler = handlers.get(type(action))
+                if handler: handler(action)
         except Exception as e: print(f"FATAL Error processing GUI queue: {e}"); import traceback; traceback.print_exc(); self.set_status(f"GUI Error: {e}", True)
-        # Schedule next check
-        try: self.root.after(self.queue_check_interval, self.process_gui_queue)
+        if self.command_successes: # One status line per pass, e.g. "Chambers 1, 2, 3: LEDs updated."
+            successes = self.command_successes; self.command_successes = {}
+            if not self.command_errors: # An error from this pass keeps the status bar
+                self.set_status("; ".join(f"Chamber{'s' if len(chambers) > 1 else ''} {', '.join(map(str, chambers))}: {msg}"
+                                          for msg, chambers in successes.items()))
+        self.process_status_updates() # Status bar shares this tick instead of its own timer
+        if self.command_errors and not self.gui_queue: # One dialog once the burst is drained, not one per pass or board
+            errors = self.command_errors; self.command_errors = []
+            messagebox.showerror("Command Error", "\n".join(errors))
+        # Schedule next check; back off while idle, snap back as soon as actions arrive
+        if processed: self.queue_check_interval = TIMINGS['queue_check_interval']
+        else: self.queue_check_interval = min(self.queue_check_interval * 2, TIMINGS['queue_check_idle_max'])
+        try: self.gui_queue_timer = self.root.after(self.queue_check_interval, self.process_gui_queue)
         except tk.TclError: print("Queue Check: Root window destroyed.")
 
-    def duty_cycle_from_percentage(self, percentage):
-        """Convert percentage (0-100) to duty cycle (0-4095)."""
-        try: percentage = max(0, min(100, int(percentage)))
-        except (ValueError, TypeError): percentage = 0
-        return DUTY_CYCLE_LOOKUP.get(percentage, 0)
-
 if __name__ == "__main__":
     root = tk.Tk()
     root.minsize(1300, 750) # Set minimum size
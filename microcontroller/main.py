@@ -22,7 +22,7 @@ CHANNELS = {
 }
 
 # Default LED duty values (all off by default)
-DEFAULT_DUTY_VALUES = [0, 0, 0, 0, 0, 0]
+DEFAULT_DUTY_VALUES = (0, 0, 0, 0, 0, 0)  # Immutable, safe to hand out from load_led_state
 
 # Initialize fan control
 fan_pwm = PWM(Pin.board.D1, freq=25_000, duty_u16=0)  # starts off
@@ -157,7 +157,11 @@ def parse_command(cmd):
         if not parts:
             return False, "ERR:EMPTY"
             
-        if parts[0] == "SETALL" and len(parts) == 7:
+        if parts[0] == "PING":
+            # Readiness probe sent by the host right after opening the port
+            print("OK")
+            return True, "OK"
+        elif parts[0] == "SETALL" and len(parts) == 7:
             # Format: "SETALL d0 d1 d2 d3 d4 d5"
             duty_values = [int(x) for x in parts[1:7]]
             # Apply and save settings